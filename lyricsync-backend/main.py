@@ -1,12 +1,5 @@
 """Main entry point for the LyricSync Audio Transcription Server."""
 
-import sys
-from pathlib import Path
-
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
 from src.api.routes import app
 from src.core.config import config
 
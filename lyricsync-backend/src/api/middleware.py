@@ -0,0 +1,41 @@
+"""ASGI middleware for the transcription API."""
+
+from typing import FrozenSet
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+# Allowance for multipart boundaries and the other form fields around the file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Reject uploads by their Content-Length before any of the body is received.
+    
+    Pure ASGI, so other requests (health polls, the SSE stream) pass straight
+    through. Chunked requests without the header fall through to the size check
+    done while the upload is read.
+    """
+    
+    __slots__ = ('app', 'max_file_size', 'paths')
+    
+    def __init__(self, app: ASGIApp, max_file_size: int, paths: FrozenSet[str]):
+        self.app = app
+        self.max_file_size = max_file_size
+        self.paths = paths
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] in self.paths:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_file_size + MULTIPART_OVERHEAD_BYTES:
+                        response = ORJSONResponse(
+                            status_code=413,
+                            content={"detail": f"File too large. Maximum size: {self.max_file_size / 1024 / 1024:.1f}MB"}
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        
+        await self.app(scope, receive, send)
@@ -1,26 +1,40 @@
 """FastAPI application setup and route definitions."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Optional
+
+import orjson
+import torch
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Request, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from ..core.config import config, QualityLevel, ModelSize
 from ..models.whisper_manager import WhisperModelManager
 from ..services.text_processing import TranscriptionCleaner
 from ..validation.file_validator import FileValidator
 from ..services.transcription import TranscriptionService
+from ..services.batching import RequestBatcher
 from ..monitoring.diagnostics import SystemDiagnosticService
+from .middleware import UploadSizeLimitMiddleware
 
 
 class TranscriptionAPI:
     """Main API application class."""
     
+    __slots__ = (
+        'logger', 'app', 'model_manager', 'text_cleaner', 'file_validator', 'batcher',
+        'inference_executor', 'transcription_service', 'diagnostic_service'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.app = self._create_app()
+        self._register_middleware()
         self._initialize_services()
+        self._register_events()
         self._register_routes()
     
     def _create_app(self) -> FastAPI:
@@ -30,22 +44,50 @@ class TranscriptionAPI:
             description="Local API server for audio transcription using OpenAI Whisper",
             version="2.0.0",
             docs_url="/docs",
-            redoc_url="/redoc"
+            redoc_url="/redoc",
+            default_response_class=ORJSONResponse
         )
         
         return app
     
+    def _register_middleware(self) -> None:
+        """Register ASGI middleware."""
+        self.app.add_middleware(
+            UploadSizeLimitMiddleware,
+            max_file_size=config.max_file_size,
+            paths=frozenset({"/transcribe", "/transcribe/stream"})
+        )
+    
     def _initialize_services(self) -> None:
-        """Initialize all service dependencies."""
+        """Allocate service placeholders; services are built on application startup."""
+        self.model_manager = None
+        self.text_cleaner = None
+        self.file_validator = None
+        self.batcher = None
+        self.inference_executor = None
+        self.transcription_service = None
+        self.diagnostic_service = None
+    
+    def _start_services(self) -> None:
+        """Initialize all service dependencies (the Whisper model is loaded by warmup)."""
         try:
             # Initialize core services
             self.model_manager = WhisperModelManager(config)
-            self.text_cleaner = TranscriptionCleaner()
+            self.text_cleaner = TranscriptionCleaner(config.regex_repetition_cleanup)
             self.file_validator = FileValidator(config)
+            self.batcher = None
+            if config.request_batching:
+                self.batcher = RequestBatcher(config, self.model_manager)
+            # Grad mode is thread-local, so disable autograd in each inference thread
+            self.inference_executor = ThreadPoolExecutor(
+                max_workers=max(1, config.inference_threads), thread_name_prefix="inference",
+                initializer=torch.set_grad_enabled, initargs=(False,)
+            )
             self.transcription_service = TranscriptionService(
-                self.model_manager, self.text_cleaner, self.file_validator, config
+                self.model_manager, self.text_cleaner, self.file_validator, config,
+                self.batcher, self.inference_executor
             )
-            self.diagnostic_service = SystemDiagnosticService()
+            self.diagnostic_service = SystemDiagnosticService(config.diagnostics_cache_ttl)
             
             self.logger.info("All services initialized successfully")
             
@@ -53,6 +95,25 @@ class TranscriptionAPI:
             self.logger.error(f"Failed to initialize services: {e}")
             raise RuntimeError(f"Service initialization failed: {e}")
     
+    def _register_events(self) -> None:
+        """Register application lifecycle events."""
+        
+        @self.app.on_event("startup")
+        async def startup():
+            """Build services so importing the app never loads the model."""
+            self._start_services()
+            self.transcription_service.warmup()
+            if self.batcher is not None:
+                await self.batcher.start()
+        
+        @self.app.on_event("shutdown")
+        async def shutdown():
+            """Stop the cross-request batch consumer and inference threads."""
+            if self.batcher is not None:
+                await self.batcher.stop()
+            if self.inference_executor is not None:
+                self.inference_executor.shutdown(wait=False)
+    
     def _register_routes(self) -> None:
         """Register all API routes."""
         
@@ -75,6 +136,7 @@ class TranscriptionAPI:
                 "version": "2.0.0",
                 "endpoints": {
                     "transcribe": "POST /transcribe - Upload audio file for transcription",
+                    "transcribe_stream": "POST /transcribe/stream - Stream transcription segments (SSE)",
                     "system_check": "GET /system-check - System diagnostics",
                     "privacy_check": "GET /privacy-check - Privacy verification",
                     "health": "GET /health - Health check",
@@ -86,7 +148,8 @@ class TranscriptionAPI:
         async def transcribe_audio(
             file: UploadFile = File(...), 
             quality: Optional[str] = Form("balanced"),
-            model_size: Optional[str] = Form(None)
+            model_size: Optional[str] = Form(None),
+            batch_size: Optional[int] = Form(None)
         ) -> Dict[str, str]:
             """
             Transcribe audio file to text using OpenAI Whisper.
@@ -94,34 +157,21 @@ class TranscriptionAPI:
             Args:
                 file: Audio file to transcribe (multipart/form-data)
                 quality: Transcription quality level (fast/balanced/high/best)
-                model_size: Whisper model size (small/medium/large-v3)
+                model_size: Whisper model size (small/medium/large-v3/large-v3-turbo/distil-large-v3)
+                batch_size: Audio chunks decoded per batch (faster-whisper only)
                 
             Returns:
                 JSON response with transcription text
             """
-            try:
-                # Parse quality level
-                quality_level = QualityLevel(quality)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid quality level. Choose from: {[q.value for q in QualityLevel]}"
-                )
+            quality_level = self._parse_quality(quality)
+            model_size_enum = self._parse_model_size(model_size)
             
-            # Parse model size if provided
-            model_size_enum = None
-            if model_size:
-                try:
-                    model_size_enum = ModelSize(model_size)
-                except ValueError:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Invalid model size. Choose from: {[m.value for m in ModelSize]}"
-                    )
+            if batch_size is not None and batch_size < 1:
+                raise HTTPException(status_code=400, detail="Batch size must be at least 1")
             
             try:
                 transcription = await self.transcription_service.transcribe_file(
-                    file, quality_level, model_size_enum
+                    file, quality_level, model_size_enum, batch_size
                 )
                 return {"transcription": transcription}
                 
@@ -131,24 +181,59 @@ class TranscriptionAPI:
                 self.logger.error(f"Unexpected error during transcription: {e}")
                 raise HTTPException(status_code=500, detail="Internal server error")
         
+        @self.app.post("/transcribe/stream")
+        async def transcribe_audio_stream(
+            file: UploadFile = File(...),
+            quality: Optional[str] = Form("balanced"),
+            model_size: Optional[str] = Form(None)
+        ) -> StreamingResponse:
+            """
+            Transcribe audio file and stream segments as Server-Sent Events.
+            
+            Args:
+                file: Audio file to transcribe (multipart/form-data)
+                quality: Transcription quality level (fast/balanced/high/best)
+                model_size: Whisper model size (small/medium/large-v3/large-v3-turbo/distil-large-v3)
+                
+            Returns:
+                text/event-stream of raw {"segment": ...} events, then a "done" event
+                carrying the cleaned {"transcription": ...}
+            """
+            quality_level = self._parse_quality(quality)
+            model_size_enum = self._parse_model_size(model_size)
+            
+            try:
+                segments = await self.transcription_service.stream_transcription(
+                    file, quality_level, model_size_enum
+                )
+            except HTTPException:
+                raise
+            except Exception as e:
+                self.logger.error(f"Unexpected error during transcription: {e}")
+                raise HTTPException(status_code=500, detail="Internal server error")
+            
+            return StreamingResponse(self._sse_events(segments), media_type="text/event-stream")
+        
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint."""
-            device_info = self.model_manager.get_device_info()
+            # Polled frequently, so skip the CUDA queries this response does not use
+            device_info = self.model_manager.get_device_info(include_gpu=False)
             return {
                 "status": "healthy",
                 "model": f"whisper-{device_info.get('model_size', 'unknown')}",
                 "device": device_info.get('device', 'unknown'),
                 "quality_options": [q.value for q in QualityLevel],
-                "model_sizes": [m.value for m in ModelSize],
-                "supported_formats": list(config.supported_formats)
+                "model_sizes": [m.value for m in self.model_manager.supported_model_sizes],
+                "supported_formats": sorted(config.supported_formats)
             }
         
         @self.app.get("/system-check")
-        async def system_check():
-            """System diagnostic endpoint."""
-            system_info = self.diagnostic_service.get_system_info()
-            device_info = self.model_manager.get_device_info()
+        async def system_check(live: bool = False):
+            """System diagnostic endpoint (?live=1 bypasses cached probes)."""
+            system_info = self.diagnostic_service.get_system_info(live)
+            # GPU details come from the TTL-cached system info; don't overwrite them with live queries
+            device_info = self.model_manager.get_device_info(include_gpu=False)
             
             return {
                 **system_info,
@@ -158,8 +243,8 @@ class TranscriptionAPI:
         @self.app.get("/privacy-check")
         async def privacy_check():
             """Privacy verification endpoint."""
-            privacy_info = self.diagnostic_service.get_privacy_info()
-            device_info = self.model_manager.get_device_info()
+            privacy_info = self.diagnostic_service.get_privacy_info(self.model_manager.backend)
+            device_info = self.model_manager.get_device_info(include_gpu=False)
             
             privacy_info["technical_details"]["processing_device"] = device_info.get("device")
             
@@ -173,7 +258,7 @@ class TranscriptionAPI:
         @self.app.exception_handler(404)
         async def not_found_handler(request: Request, exc: HTTPException):
             """Custom 404 handler."""
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"detail": "Endpoint not found. Visit /docs for API documentation."}
             )
@@ -182,11 +267,56 @@ class TranscriptionAPI:
         async def internal_error_handler(request: Request, exc: HTTPException):
             """Custom 500 handler."""
             self.logger.error(f"Internal server error: {exc}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error. Check server logs for details."}
             )
     
+    def _parse_quality(self, quality: str) -> QualityLevel:
+        """Parse a quality level form value."""
+        try:
+            return QualityLevel(quality)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid quality level. Choose from: {[q.value for q in QualityLevel]}"
+            )
+    
+    def _parse_model_size(self, model_size: Optional[str]) -> Optional[ModelSize]:
+        """Parse an optional model size form value."""
+        if not model_size:
+            return None
+        
+        supported = self.model_manager.supported_model_sizes
+        try:
+            size = ModelSize(model_size)
+        except ValueError:
+            size = None
+        
+        if size not in supported:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid model size. Choose from: {[m.value for m in supported]}"
+            )
+        return size
+    
+    async def _sse_events(self, segments: AsyncIterator[str]) -> AsyncIterator[bytes]:
+        """Format segment texts as Server-Sent Events, ending with the cleaned transcript."""
+        texts = []
+        try:
+            async for text in segments:
+                texts.append(text)
+                yield b"data: " + orjson.dumps({"segment": text}) + b"\n\n"
+            
+            # Cleanup needs the whole transcript to catch repetitions that span segments
+            transcription = await asyncio.to_thread(self.text_cleaner.clean_text, "".join(texts))
+            yield b"event: done\ndata: " + orjson.dumps({"transcription": transcription}) + b"\n\n"
+        except Exception as e:
+            # Headers are already sent, so report failures in-band
+            detail = e.detail if isinstance(e, HTTPException) else "Transcription failed"
+            self.logger.error(f"Streaming transcription failed: {e}")
+            yield b"event: error\ndata: " + orjson.dumps({"detail": detail}) + b"\n\n"
+    
     def get_app(self) -> FastAPI:
         """Get the FastAPI application instance."""
         return self.app
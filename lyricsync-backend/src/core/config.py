@@ -1,8 +1,8 @@
 """Configuration module for the LyricSync Audio Transcription application."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Set
+from typing import FrozenSet
 import logging
 import os
 
@@ -20,6 +20,14 @@ class ModelSize(Enum):
     SMALL = "small"
     MEDIUM = "medium"
     LARGE = "large-v3"
+    TURBO = "large-v3-turbo"
+    DISTIL = "distil-large-v3"  # faster-whisper only
+
+
+class WhisperBackend(Enum):
+    """Enumeration for Whisper inference backends."""
+    FASTER = "faster-whisper"
+    OPENAI = "openai-whisper"
 
 
 @dataclass
@@ -28,10 +36,23 @@ class AppConfig:
     host: str = "0.0.0.0"
     port: int = 8001
     log_level: str = "INFO"
-    whisper_model: str = "small"
+    whisper_backend: WhisperBackend = WhisperBackend.FASTER
+    compute_type: str = ""  # faster-whisper compute type; empty picks int8 (CPU) / int8_float16 (GPU)
     default_model_size: ModelSize = ModelSize.SMALL
+    model_cache_size: int = 2  # Loaded models kept resident (LRU)
+    batch_size: int = 8  # Audio chunks decoded per batched forward pass
+    inference_threads: int = 3  # Concurrent inferences sharing one resident model
+    vad_filter: bool = True  # Skip non-speech audio before decoding
+    offline_models: bool = False  # Never download faster-whisper models; use the local hub cache only
+    use_torch_compile: bool = False  # torch.compile encoder/decoder (openai-whisper on CUDA)
+    request_batching: bool = False  # Batch windows across concurrent requests
+    request_batch_size: int = 16  # Max windows per cross-request batch
+    request_batch_wait_ms: int = 20  # Max time to wait for a batch to fill
     max_file_size: int = 100 * 1024 * 1024  # 100MB
-    supported_formats: Set[str] = None
+    supported_formats: FrozenSet[str] = None
+    supported_formats_display: str = field(init=False, default="")  # Sorted list for error messages
+    regex_repetition_cleanup: bool = False  # Use the legacy regex repetition cleanup
+    diagnostics_cache_ttl: float = 30.0  # Seconds to reuse diagnostic probe results
     
     def __post_init__(self):
         """Initialize default values and configure logging."""
@@ -40,9 +61,22 @@ class AppConfig:
                 '.mp3', '.wav', '.m4a', '.flac', '.ogg', 
                 '.wma', '.aac', '.mp4', '.mov', '.avi'
             }
+        self.supported_formats = frozenset(self.supported_formats)
+        self.supported_formats_display = ', '.join(sorted(self.supported_formats))
         
         # Override with environment variables if available
-        self.whisper_model = os.getenv("WHISPER_MODEL", self.whisper_model)
+        self.whisper_backend = WhisperBackend(os.getenv("WHISPER_BACKEND", self.whisper_backend.value))
+        self.compute_type = os.getenv("COMPUTE_TYPE", self.compute_type)
+        self.model_cache_size = int(os.getenv("MODEL_CACHE_SIZE", self.model_cache_size))
+        self.batch_size = int(os.getenv("BATCH_SIZE", self.batch_size))
+        self.inference_threads = int(os.getenv("INFERENCE_THREADS", self.inference_threads))
+        self.vad_filter = os.getenv("VAD_FILTER", str(self.vad_filter)).lower() in ("1", "true", "yes")
+        self.offline_models = os.getenv("OFFLINE_MODELS", str(self.offline_models)).lower() in ("1", "true", "yes")
+        self.use_torch_compile = os.getenv("USE_TORCH_COMPILE", str(self.use_torch_compile)).lower() in ("1", "true", "yes")
+        self.regex_repetition_cleanup = os.getenv("REGEX_REPETITION_CLEANUP", str(self.regex_repetition_cleanup)).lower() in ("1", "true", "yes")
+        self.request_batching = os.getenv("REQUEST_BATCHING", str(self.request_batching)).lower() in ("1", "true", "yes")
+        self.request_batch_size = int(os.getenv("REQUEST_BATCH_SIZE", self.request_batch_size))
+        self.request_batch_wait_ms = int(os.getenv("REQUEST_BATCH_WAIT_MS", self.request_batch_wait_ms))
         self.host = os.getenv("HOST", self.host)
         self.port = int(os.getenv("PORT", self.port))
         
@@ -7,14 +7,16 @@ from typing import Dict, Any, Protocol
 class ModelManager(ABC):
     """Abstract base class for model management."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def load_model(self, model_name: str) -> Any:
         """Load a model with the given name."""
         pass
     
     @abstractmethod
-    def get_device_info(self) -> Dict[str, Any]:
-        """Get information about the current device."""
+    def get_device_info(self, include_gpu: bool = True) -> Dict[str, Any]:
+        """Get information about the current device (include_gpu=False skips CUDA driver queries)."""
         pass
     
     @property
@@ -22,6 +24,12 @@ class ModelManager(ABC):
     def device(self) -> str:
         """Get the current device."""
         pass
+    
+    @property
+    @abstractmethod
+    def backend(self) -> Any:
+        """Get the active inference backend."""
+        pass
 
 
 class TextProcessor(Protocol):
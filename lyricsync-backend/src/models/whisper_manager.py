@@ -1,42 +1,125 @@
 """Model management for Whisper transcription models."""
 
 import logging
-from typing import Dict, Any
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
 
+import numpy as np
 import torch
 import whisper
 
+try:
+    from faster_whisper import WhisperModel, download_model
+except ImportError:
+    WhisperModel = None
+    download_model = None
+
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+try:
+    from flash_attn import flash_attn_func
+except ImportError:
+    flash_attn_func = None
+
 from ..core.interfaces import ModelManager
-from ..core.config import AppConfig, QualityLevel, ModelSize
+from ..core.config import AppConfig, QualityLevel, ModelSize, WhisperBackend
+
+
+# Two seconds of 16 kHz audio
+WARMUP_SAMPLES = 16000 * 2
+
+# CPU copies kept for GPU out-of-memory fallback
+CPU_FALLBACK_CACHE_SIZE = 1
+
+_stock_qkv_attention = whisper.model.MultiHeadAttention.qkv_attention
+
+
+def _flash_qkv_attention(self, q, k, v, mask=None):
+    """Drop-in for MultiHeadAttention.qkv_attention backed by FlashAttention-2."""
+    if not q.is_cuda or q.dtype not in (torch.float16, torch.bfloat16):
+        return _stock_qkv_attention(self, q, k, v, mask)
+    
+    n_batch, n_ctx, _ = q.shape
+    q = q.view(n_batch, n_ctx, self.n_head, -1)
+    k = k.view(*k.shape[:2], self.n_head, -1)
+    v = v.view(*v.shape[:2], self.n_head, -1)
+    
+    # Decoder self-attention passes a mask; single-token steps attend to the whole cache
+    out = flash_attn_func(q, k, v, causal=mask is not None and n_ctx > 1)
+    
+    # Attention weights are never materialized; they are only needed for word timestamps
+    return out.flatten(start_dim=2), None
 
 
 class WhisperModelManager(ModelManager):
     """Concrete implementation of ModelManager for Whisper models."""
     
+    __slots__ = (
+        'config', 'logger', '_model', '_device', '_model_size', '_backend',
+        '_model_cache', '_cpu_models', '_batched_pipelines', '_cache_lock', '_inference_lock'
+    )
+    
     def __init__(self, config: AppConfig):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self._model = None
         self._device = None
         self._model_size = None
+        self._backend = None
+        self._model_cache: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+        # CPU copies for GPU out-of-memory fallback, kept apart so they never evict GPU models
+        self._cpu_models: "OrderedDict[str, Any]" = OrderedDict()
+        self._batched_pipelines: Dict[int, Any] = {}
+        # Guards every change to the model caches: inference threads scan them
+        # (to create pipelines) while loads insert, reorder and evict models
+        self._cache_lock = threading.Lock()
+        # openai-whisper installs per-call KV-cache hooks on the shared model
+        self._inference_lock = threading.Lock()
         self._initialize()
     
     def _initialize(self) -> None:
         """Initialize the model manager."""
         self._setup_device()
-        self.load_model()
+        self._setup_backend()
+        self._enable_flash_attention()
+        # No model is loaded here: startup warms the default quality model once,
+        # instead of loading and warming a second one that requests rarely use
     
-    def load_model(self, model_name: str = None) -> whisper.Whisper:
-        """Load Whisper model with GPU optimization."""
-        if model_name is None:
-            model_name = self.config.whisper_model
-            
-        self._model_size = model_name
+    def _setup_backend(self) -> None:
+        """Select the inference backend (faster-whisper or openai-whisper)."""
+        self._backend = self.config.whisper_backend
         
+        if self._backend == WhisperBackend.FASTER and WhisperModel is None:
+            self.logger.warning("faster-whisper not installed, falling back to openai-whisper")
+            self._backend = WhisperBackend.OPENAI
+        
+        self.logger.info(f"Using {self._backend.value} backend")
+    
+    def _enable_flash_attention(self) -> None:
+        """Patch openai-whisper attention to use FlashAttention-2 on Ampere+ GPUs."""
+        if self._backend != WhisperBackend.OPENAI or self._device != "cuda" or flash_attn_func is None:
+            return
+        
+        if torch.cuda.get_device_capability(0)[0] < 8:
+            self.logger.info("FlashAttention-2 requires an Ampere or newer GPU, using stock attention")
+            return
+        
+        whisper.model.MultiHeadAttention.qkv_attention = _flash_qkv_attention
+        self.logger.info("Using FlashAttention-2 kernels for Whisper attention")
+    
+    def load_model(self, model_name: str) -> Any:
+        """Load Whisper model with GPU optimization."""
         self.logger.info(f"Loading Whisper model '{model_name}' on {self._device}")
         
         try:
-            self._model = whisper.load_model(model_name, device=self._device)
+            self._model = self._get_or_load_model(model_name)
+            # Only record the size once loaded, so a failed load doesn't mask the current model
+            self._model_size = model_name
             self.logger.info(f"Whisper model '{model_name}' loaded successfully on {self._device}")
             
             if self._device == "cuda":
@@ -49,6 +132,114 @@ class WhisperModelManager(ModelManager):
             self.logger.info("Please ensure CUDA is properly installed for GPU acceleration")
             raise RuntimeError(f"Model loading failed: {e}")
     
+    def _get_or_load_model(self, model_name: str) -> Any:
+        """Return a cached model or load it, evicting the least recently used one."""
+        key = (model_name, self._device, self._model_dtype(self._device))
+        
+        model = self._model_cache.get(key)
+        if model is not None:
+            with self._cache_lock:
+                self._model_cache.move_to_end(key)
+            self.logger.info(f"Reusing cached Whisper model '{model_name}' on {self._device}")
+            return model
+        
+        model = self._load_backend_model(model_name, self._device)
+        with self._cache_lock:
+            self._model_cache[key] = model
+        
+        self._warmup(model)
+        
+        while len(self._model_cache) > max(1, self.config.model_cache_size):
+            with self._cache_lock:
+                (evicted_name, _, _), evicted_model = self._model_cache.popitem(last=False)
+                self._batched_pipelines.pop(id(evicted_model), None)
+            del evicted_model
+            self.logger.info(f"Evicted Whisper model '{evicted_name}' from cache")
+            if self._device == "cuda":
+                torch.cuda.empty_cache()
+        
+        return model
+    
+    def _load_backend_model(self, model_name: str, device: str) -> Any:
+        """Load a model with the selected backend."""
+        if self._backend == WhisperBackend.FASTER:
+            # One CTranslate2 worker per inference thread so concurrent transcriptions overlap;
+            # cores are split between the workers instead of each claiming all of them
+            workers = max(1, self.config.inference_threads)
+            return WhisperModel(
+                self._resolve_model_path(model_name),
+                device=device,
+                compute_type=self._compute_type(device),
+                num_workers=workers,
+                cpu_threads=max(1, (os.cpu_count() or 1) // workers)
+            )
+        
+        model = whisper.load_model(model_name, device=device)
+        
+        if self.config.use_torch_compile and device == "cuda" and hasattr(torch, "compile"):
+            # Fuses the encoder's pointwise ops and replays it as a CUDA graph
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead", fullgraph=False)
+            # Decoder inputs grow token by token, so compile for dynamic shapes without CUDA graphs
+            model.decoder = torch.compile(model.decoder, dynamic=True, fullgraph=False)
+            self.logger.info(f"Compiled encoder and decoder of '{model_name}' with torch.compile")
+        
+        return model
+    
+    def _resolve_model_path(self, model_name: str) -> str:
+        """Resolve a faster-whisper model to its local Hugging Face cache directory.
+        
+        Loading by name contacts huggingface.co on every load, so the hub is only
+        used when the model is not cached yet (and never with OFFLINE_MODELS).
+        """
+        try:
+            return download_model(model_name, local_files_only=True)
+        except Exception:
+            if self.config.offline_models:
+                raise RuntimeError(f"Model '{model_name}' is not in the local cache and OFFLINE_MODELS is set")
+        
+        self.logger.info(f"Downloading Whisper model '{model_name}' from the Hugging Face Hub")
+        return download_model(model_name)
+    
+    def _warmup(self, model: Any) -> None:
+        """Run a forward pass on silence so kernel selection happens before the first request.
+        
+        Audio is padded to a full 30s window, so this also triggers torch.compile
+        and CUDA graph capture for the shapes used by real requests.
+        """
+        silence = np.zeros(WARMUP_SAMPLES, dtype=np.float32)
+        
+        try:
+            with torch.inference_mode():
+                if self._backend == WhisperBackend.FASTER:
+                    segments, _ = model.transcribe(silence, beam_size=1)
+                    list(segments)
+                else:
+                    model.transcribe(silence, fp16=self.fp16, verbose=None)
+            self.logger.info("Whisper model warmed up")
+        except Exception as e:
+            self.logger.warning(f"Model warmup failed: {e}")
+    
+    def get_batched_pipeline(self, model: Any) -> Any:
+        """Get a batched inference pipeline for a cached faster-whisper model, if supported."""
+        if self._backend != WhisperBackend.FASTER or BatchedInferencePipeline is None:
+            return None
+        
+        with self._cache_lock:
+            pipeline = self._batched_pipelines.get(id(model))
+            if pipeline is None:
+                # A pipeline for an evicted model would never be dropped and would pin its weights
+                if not self._is_cached(model):
+                    return None
+                pipeline = BatchedInferencePipeline(model=model)
+                self._batched_pipelines[id(model)] = pipeline
+        
+        return pipeline
+    
+    def _is_cached(self, model: Any) -> bool:
+        """Check whether a model is still held by the model cache or the CPU fallback cache."""
+        return (any(cached is model for cached in self._model_cache.values())
+                or any(cached is model for cached in self._cpu_models.values()))
+    
     def _setup_device(self) -> None:
         """Setup computing device (CUDA or CPU)."""
         if torch.cuda.is_available():
@@ -58,27 +249,32 @@ class WhisperModelManager(ModelManager):
             self.logger.info(f"GPU detected: {gpu_name} ({gpu_memory:.1f}GB VRAM)")
             self.logger.info("Using GPU acceleration for transcription")
             torch.cuda.empty_cache()
+            
+            # Whisper's 30s windows have a fixed shape, so autotuned kernels are reused
+            torch.backends.cudnn.benchmark = True
+            torch.set_float32_matmul_precision("high")
         else:
             self._device = "cpu"
             self.logger.warning("CUDA not available, falling back to CPU")
     
     def _log_gpu_memory(self, context: str) -> None:
         """Log GPU memory usage."""
-        if self._device == "cuda":
+        if self._device == "cuda" and self.logger.isEnabledFor(logging.INFO):
             memory_allocated = torch.cuda.memory_allocated(0) / 1024**3
             memory_reserved = torch.cuda.memory_reserved(0) / 1024**3
             self.logger.info(f"GPU memory usage {context}: {memory_allocated:.2f}GB allocated, {memory_reserved:.2f}GB reserved")
     
-    def get_device_info(self) -> Dict[str, Any]:
-        """Get device information."""
+    def get_device_info(self, include_gpu: bool = True) -> Dict[str, Any]:
+        """Get device information (include_gpu=False skips the CUDA driver and allocator queries)."""
         info = {
             "device": self._device,
             "model_size": self._model_size,
+            "backend": self._backend.value if self._backend else None,
             "torch_version": torch.__version__,
             "cuda_available": torch.cuda.is_available()
         }
         
-        if torch.cuda.is_available():
+        if include_gpu and torch.cuda.is_available():
             info.update({
                 "gpu_name": torch.cuda.get_device_name(0),
                 "gpu_memory_total": f"{torch.cuda.get_device_properties(0).total_memory / 1024**3:.1f}GB",
@@ -91,7 +287,7 @@ class WhisperModelManager(ModelManager):
         return info
     
     @property
-    def model(self) -> whisper.Whisper:
+    def model(self) -> Any:
         """Get the loaded model."""
         if self._model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
@@ -102,13 +298,58 @@ class WhisperModelManager(ModelManager):
         """Get the current device."""
         return self._device
     
-    def load_quality_model(self, quality: QualityLevel, model_size: ModelSize = None) -> whisper.Whisper:
+    @property
+    def model_size(self) -> str:
+        """Get the name of the current model."""
+        return self._model_size
+    
+    @property
+    def inference_lock(self) -> threading.Lock:
+        """Lock serializing openai-whisper calls on shared models."""
+        return self._inference_lock
+    
+    @property
+    def fp16(self) -> bool:
+        """Whether openai-whisper should run its FP16 path (any CUDA device)."""
+        return self._device == "cuda"
+    
+    @property
+    def compute_type(self) -> str:
+        """Get the CTranslate2 compute type used by the faster-whisper backend."""
+        return self._compute_type(self._device)
+    
+    def _compute_type(self, device: str) -> str:
+        """CTranslate2 compute type for models loaded on a device."""
+        # The configured type targets the primary device; CPU fallback models use the CPU default
+        if self.config.compute_type and device == self._device:
+            return self.config.compute_type
+        # int8 weights use VNNI dot products on CPU; activations stay FP16 on GPU
+        return "int8_float16" if device == "cuda" else "int8"
+    
+    def _model_dtype(self, device: str) -> str:
+        """Weight precision of models loaded by the active backend (part of the cache key)."""
+        return self._compute_type(device) if self._backend == WhisperBackend.FASTER else "float32"
+    
+    @property
+    def backend(self) -> WhisperBackend:
+        """Get the active inference backend."""
+        return self._backend
+    
+    @property
+    def supported_model_sizes(self) -> Tuple[ModelSize, ...]:
+        """Model sizes the active backend can load."""
+        if self._backend == WhisperBackend.FASTER:
+            return tuple(ModelSize)
+        # Distil-Whisper checkpoints are only published in CTranslate2 format
+        return tuple(size for size in ModelSize if size != ModelSize.DISTIL)
+    
+    def load_quality_model(self, quality: QualityLevel, model_size: ModelSize = None) -> Any:
         """Load model based on quality preference and model size."""
         quality_models = {
             QualityLevel.FAST: "tiny",
             QualityLevel.BALANCED: "base",
             QualityLevel.HIGH: "small",
-            QualityLevel.BEST: "medium"
+            QualityLevel.BEST: ModelSize.TURBO.value  # Pruned decoder: large-v3 accuracy at several times the speed
         }
         
         # Use explicit model size if provided, otherwise use quality mapping
@@ -123,14 +364,36 @@ class WhisperModelManager(ModelManager):
         
         return self._model
     
-    def load_model_by_size(self, model_size: ModelSize) -> whisper.Whisper:
+    def load_cpu_model(self, model_name: str) -> Any:
+        """Get a CPU copy of a model, for requests that exceed the GPU memory budget."""
+        model = self._cpu_models.get(model_name)
+        if model is not None:
+            with self._cache_lock:
+                self._cpu_models.move_to_end(model_name)
+            return model
+        
+        self.logger.info(f"Loading CPU fallback for Whisper model '{model_name}'")
+        model = self._load_backend_model(model_name, "cpu")
+        with self._cache_lock:
+            self._cpu_models[model_name] = model
+        
+        while len(self._cpu_models) > CPU_FALLBACK_CACHE_SIZE:
+            with self._cache_lock:
+                evicted_name, evicted_model = self._cpu_models.popitem(last=False)
+                self._batched_pipelines.pop(id(evicted_model), None)
+            del evicted_model
+            self.logger.info(f"Evicted CPU fallback model '{evicted_name}'")
+        
+        return model
+    
+    def load_model_by_size(self, model_size: ModelSize) -> Any:
         """Load model by specific size."""
         model_name = model_size.value
         
         if model_name != self._model_size:
             self.logger.info(f"Loading {model_name} model")
             try:
-                self._model = whisper.load_model(model_name, device=self._device)
+                self._model = self._get_or_load_model(model_name)
                 self._model_size = model_name
                 
                 if self._device == "cuda":
@@ -1,22 +1,49 @@
 """System diagnostics and monitoring utilities."""
 
 import logging
+import shutil
 import subprocess
-from typing import Dict, Any
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
 
 import torch
 
+from ..core.config import WhisperBackend
 from ..core.interfaces import SystemDiagnostics
 
 
 class SystemDiagnosticService:
     """Provides system diagnostic capabilities."""
     
-    def __init__(self):
+    __slots__ = ('logger', '_cache_ttl', '_cache', '_ffmpeg_path', '_ffmpeg_info')
+    
+    def __init__(self, cache_ttl: float = 30.0):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Resolve and version FFmpeg once; later checks only re-run it if the binary moves
+        self._ffmpeg_path = shutil.which('ffmpeg')
+        self._ffmpeg_info = self._probe_ffmpeg(self._ffmpeg_path)
+    
+    def _cached(self, key: str, factory: Callable[[], Any], live: bool = False) -> Any:
+        """Return a probe result, re-running it only when older than the TTL."""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        
+        if not live and entry is not None and now - entry[0] < self._cache_ttl:
+            return entry[1]
+        
+        value = factory()
+        self._cache[key] = (now, value)
+        return value
+    
+    def get_system_info(self, live: bool = False) -> Dict[str, Any]:
+        """Get comprehensive system information (pass live=True to bypass the cache)."""
+        return dict(self._cached("system_info", lambda: self._collect_system_info(live), live))
     
-    def get_system_info(self) -> Dict[str, Any]:
-        """Get comprehensive system information."""
+    def _collect_system_info(self, live: bool) -> Dict[str, Any]:
+        """Collect system information."""
         info = {
             "whisper_model_loaded": True,
             "torch_version": torch.__version__,
@@ -27,15 +54,19 @@ class SystemDiagnosticService:
         
         # Add GPU information if available
         if torch.cuda.is_available():
-            info.update(self._get_gpu_info())
+            info.update(self._get_gpu_info(live))
         
         # Check FFmpeg availability
         info.update(self._check_ffmpeg())
         
         return info
     
-    def _get_gpu_info(self) -> Dict[str, Any]:
+    def _get_gpu_info(self, live: bool = False) -> Dict[str, Any]:
         """Get GPU-specific information."""
+        return self._cached("gpu_info", self._probe_gpu_info, live)
+    
+    def _probe_gpu_info(self) -> Dict[str, Any]:
+        """Query the CUDA driver for GPU information."""
         try:
             return {
                 "gpu_name": torch.cuda.get_device_name(0),
@@ -51,9 +82,27 @@ class SystemDiagnosticService:
     
     def _check_ffmpeg(self) -> Dict[str, Any]:
         """Check FFmpeg availability and version."""
+        return self._cached("ffmpeg", self._resolve_ffmpeg)
+    
+    def _resolve_ffmpeg(self) -> Dict[str, Any]:
+        """Re-resolve the FFmpeg binary, probing it again only when its path changed."""
+        ffmpeg_path = shutil.which('ffmpeg')
+        if ffmpeg_path != self._ffmpeg_path:
+            self._ffmpeg_path = ffmpeg_path
+            self._ffmpeg_info = self._probe_ffmpeg(ffmpeg_path)
+        return self._ffmpeg_info
+    
+    def _probe_ffmpeg(self, ffmpeg_path: Optional[str]) -> Dict[str, Any]:
+        """Run FFmpeg to detect its availability and version."""
+        if ffmpeg_path is None:
+            return {
+                "ffmpeg_available": False,
+                "ffmpeg_error": "FFmpeg not found in PATH"
+            }
+        
         try:
             result = subprocess.run(
-                ['ffmpeg', '-version'],
+                [ffmpeg_path, '-version'],
                 capture_output=True,
                 text=True,
                 timeout=5
@@ -88,9 +137,9 @@ class SystemDiagnosticService:
                 "ffmpeg_error": f"FFmpeg check failed: {str(e)}"
             }
     
-    def get_privacy_info(self) -> Dict[str, Any]:
-        """Get privacy and security information."""
-        return {
+    def get_privacy_info(self, backend: WhisperBackend = WhisperBackend.OPENAI) -> Dict[str, Any]:
+        """Get privacy and security information for the active inference backend."""
+        info = {
             "processing_location": "100% Local - No external APIs",
             "internet_required": False,
             "data_sent_externally": False,
@@ -107,12 +156,29 @@ class SystemDiagnosticService:
                 "network_dependencies": "None after initial setup"
             }
         }
+        
+        if backend == WhisperBackend.FASTER:
+            info["technical_details"] = {
+                "whisper_source": "faster-whisper (CTranslate2) - local inference only",
+                "model_storage": "Hugging Face Hub cache (~/.cache/huggingface/hub/) on your machine",
+                "network_dependencies": (
+                    "Each model is downloaded from huggingface.co the first time it is used; "
+                    "cached models load without network access (OFFLINE_MODELS=true forbids downloads)"
+                )
+            }
+        
+        return info
     
     def check_dependencies(self) -> Dict[str, Any]:
         """Check all required dependencies."""
+        return dict(self._cached("dependencies", self._collect_dependencies))
+    
+    def _collect_dependencies(self) -> Dict[str, Any]:
+        """Collect dependency availability and versions."""
         dependencies = {
             "torch": {"available": False, "version": None},
             "whisper": {"available": False, "version": None},
+            "faster_whisper": {"available": False, "version": None},
             "fastapi": {"available": False, "version": None},
             "ffmpeg": {"available": False, "version": None}
         }
@@ -130,6 +196,12 @@ class SystemDiagnosticService:
         except ImportError:
             pass
         
+        try:
+            import faster_whisper
+            dependencies["faster_whisper"] = {"available": True, "version": getattr(faster_whisper, '__version__', 'unknown')}
+        except ImportError:
+            pass
+        
         try:
             import fastapi
             dependencies["fastapi"] = {"available": True, "version": fastapi.__version__}
@@ -0,0 +1,44 @@
+"""Audio preprocessing helpers shared by the transcription paths."""
+
+from typing import BinaryIO, Union
+
+import numpy as np
+
+try:
+    from faster_whisper.audio import decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+except ImportError:
+    decode_audio = None
+    VadOptions = None
+    get_speech_timestamps = None
+
+
+# Model input: a path for FFmpeg to decode, or 16 kHz mono float32 samples
+AudioInput = Union[str, np.ndarray]
+
+SAMPLE_RATE = 16000
+
+# Pauses shorter than this stay inside a speech chunk
+VAD_MIN_SILENCE_MS = 500
+
+
+def decode_stream(source: BinaryIO) -> np.ndarray:
+    """Decode an audio/video stream in-process with PyAV to 16 kHz mono float32."""
+    if decode_audio is None:
+        raise RuntimeError("In-process decoding requires faster-whisper (PyAV)")
+    return decode_audio(source, sampling_rate=SAMPLE_RATE)
+
+
+def keep_speech(audio: np.ndarray) -> np.ndarray:
+    """Drop non-speech stretches of 16 kHz audio using Silero VAD.
+    
+    Returns the audio unchanged when faster-whisper's VAD is not installed.
+    """
+    if get_speech_timestamps is None:
+        return audio
+    
+    chunks = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=VAD_MIN_SILENCE_MS))
+    if not chunks:
+        return audio[:0]
+    
+    return np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in chunks])
@@ -0,0 +1,235 @@
+"""Cross-request micro-batching for Whisper transcription."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import torch
+
+from ..core.config import AppConfig, WhisperBackend
+from ..core.interfaces import ModelManager
+from .audio import AudioInput, keep_speech
+
+# Whisper's silence rule: a window is dropped only when it looks silent AND
+# its decoded text is low-confidence, matching the unbatched decoders
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+
+
+@dataclass
+class _PendingWindow:
+    """A single 30-second feature window waiting to be decoded."""
+    model: Any
+    features: Any
+    beam_size: int
+    future: asyncio.Future
+
+
+class RequestBatcher:
+    """Collects windows from concurrent requests and decodes them in shared batches.
+    
+    Every request is cut into fixed 30-second mel windows, so windows from
+    different uploads stack into one encoder batch without padding waste.
+    A single consumer drains the queue for up to ``request_batch_wait_ms``
+    or ``request_batch_size`` windows and runs one batched encoder pass and
+    decode per model (CTranslate2 generate or openai-whisper decode).
+    """
+    
+    def __init__(self, config: AppConfig, model_manager: ModelManager):
+        self.config = config
+        self.model_manager = model_manager
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue: asyncio.Queue = None
+        self._worker: asyncio.Task = None
+    
+    async def start(self) -> None:
+        """Start the background consumer."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+            self.logger.info(
+                f"Request batching enabled (max {self.config.request_batch_size} windows, "
+                f"{self.config.request_batch_wait_ms}ms window)"
+            )
+    
+    async def stop(self) -> None:
+        """Stop the background consumer."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+    
+    async def submit(self, model: Any, audio: AudioInput, beam_size: int = 5) -> str:
+        """Queue audio (a file path or decoded samples) for batched decoding and wait for its text."""
+        if self._worker is None:
+            raise RuntimeError("Request batcher not started")
+        
+        # Audio decoding and the mel spectrogram run on a worker thread
+        windows = await asyncio.to_thread(self._extract_windows, model, audio)
+        
+        loop = asyncio.get_running_loop()
+        futures = []
+        for features in windows:
+            future = loop.create_future()
+            await self._queue.put(_PendingWindow(model, features, beam_size, future))
+            futures.append(future)
+        
+        texts = await asyncio.gather(*futures)
+        return "".join(texts)
+    
+    def _extract_windows(self, model: Any, audio: AudioInput) -> List[Any]:
+        """Decode audio and split its log-mel features into 30-second windows."""
+        if self.model_manager.backend == WhisperBackend.OPENAI:
+            return self._extract_openai_windows(model, audio)
+        
+        from faster_whisper import decode_audio
+        
+        extractor = model.feature_extractor
+        if isinstance(audio, str):
+            audio = decode_audio(audio, sampling_rate=extractor.sampling_rate)
+        if self.config.vad_filter:
+            audio = keep_speech(audio)
+        
+        # Pad with 30s of silence like whisper does so the last window is full
+        features = extractor(audio, padding=extractor.n_samples)
+        content_frames = max(1, -(-len(audio) // extractor.hop_length))
+        window = extractor.nb_max_frames
+        
+        return [
+            np.ascontiguousarray(features[:, start:start + window])
+            for start in range(0, content_frames, window)
+        ]
+    
+    def _extract_openai_windows(self, model: Any, audio: AudioInput) -> List[torch.Tensor]:
+        """Compute openai-whisper log-mel windows for an audio file or samples."""
+        import whisper
+        from whisper.audio import N_FRAMES, N_SAMPLES
+        
+        if isinstance(audio, str):
+            audio = whisper.load_audio(audio)
+        if self.config.vad_filter:
+            audio = keep_speech(audio)
+        # Computing the mel on the model's device runs the STFT on cuFFT for CUDA models
+        with torch.inference_mode():
+            mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels, padding=N_SAMPLES, device=model.device)
+        content_frames = max(1, mel.shape[-1] - N_FRAMES)
+        
+        return [mel[:, start:start + N_FRAMES] for start in range(0, content_frames, N_FRAMES)]
+    
+    async def _run(self) -> None:
+        """Consume queued windows in batches."""
+        loop = asyncio.get_running_loop()
+        max_wait = self.config.request_batch_wait_ms / 1000
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + max_wait
+            
+            while len(batch) < self.config.request_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Windows can only share a forward pass when model and decoding options match
+            groups: Dict[Tuple[int, int], List[_PendingWindow]] = {}
+            for item in batch:
+                groups.setdefault((id(item.model), item.beam_size), []).append(item)
+            
+            for items in groups.values():
+                await self._process_group(items)
+    
+    async def _process_group(self, items: List[_PendingWindow]) -> None:
+        """Decode one homogeneous group and resolve its futures."""
+        try:
+            texts = await asyncio.to_thread(
+                self._decode_batch, items[0].model, [item.features for item in items], items[0].beam_size
+            )
+        except Exception as e:
+            self.logger.error(f"Batched decoding failed: {e}")
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        
+        for item, text in zip(items, texts):
+            if not item.future.done():
+                item.future.set_result(text)
+    
+    def _decode_batch(self, model: Any, windows: List[Any], beam_size: int) -> List[str]:
+        """Run one batched encoder pass and decode every window."""
+        if self.model_manager.backend == WhisperBackend.OPENAI:
+            return self._decode_openai_batch(model, windows, beam_size)
+        
+        from faster_whisper.tokenizer import Tokenizer
+        
+        encoder_output = model.encode(np.stack(windows))
+        
+        multilingual = model.model.is_multilingual
+        if multilingual:
+            # Most likely language token per window, e.g. "<|it|>" -> "it"
+            languages = [
+                scores[0][0][2:-2] for scores in model.model.detect_language(encoder_output)
+            ]
+        else:
+            languages = ["en"] * len(windows)
+        
+        tokenizers = [
+            Tokenizer(model.hf_tokenizer, multilingual, task="transcribe", language=language)
+            for language in languages
+        ]
+        prompts = [list(tokenizer.sot_sequence) + [tokenizer.no_timestamps] for tokenizer in tokenizers]
+        
+        results = model.model.generate(
+            encoder_output,
+            prompts,
+            beam_size=beam_size,
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+        )
+        
+        texts = []
+        for tokenizer, result in zip(tokenizers, results):
+            tokens = result.sequences_ids[0]
+            # CTranslate2 scores are length-normalized; rescale the way faster-whisper does
+            avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+            if result.no_speech_prob > NO_SPEECH_THRESHOLD and avg_logprob <= LOG_PROB_THRESHOLD:
+                texts.append("")
+            else:
+                texts.append(" " + tokenizer.decode(tokens).strip())
+        
+        self.logger.debug(f"Decoded batch of {len(windows)} windows")
+        return texts
+    
+    def _decode_openai_batch(self, model: Any, windows: List[torch.Tensor], beam_size: int) -> List[str]:
+        """Decode a batch of mel windows with openai-whisper's batched decoder."""
+        import whisper
+        
+        options = whisper.DecodingOptions(
+            beam_size=beam_size if beam_size > 1 else None,
+            without_timestamps=True,
+            fp16=self.model_manager.fp16
+        )
+        
+        # Shares the model's KV-cache hooks with non-batched calls, so serialize with them
+        with self.model_manager.inference_lock, torch.inference_mode():
+            results = whisper.decode(model, torch.stack(windows).to(model.device), options)
+        
+        texts = [
+            ""
+            if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOG_PROB_THRESHOLD
+            else " " + result.text.strip()
+            for result in results
+        ]
+        
+        self.logger.debug(f"Decoded batch of {len(windows)} windows")
+        return texts
\ No newline at end of file
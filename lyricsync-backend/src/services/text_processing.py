@@ -1,23 +1,87 @@
 """Text processing and cleaning utilities."""
 
 import logging
+import platform
 import re
-from typing import List
+import threading
+from itertools import takewhile
+from typing import List, Optional
+
+try:
+    # Linear-time automaton engine; falls back to the backtracking stdlib engine
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+try:
+    # SIMD multi-pattern matcher (x86 only)
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+SUBTITLE_PATTERNS: List[str] = [
+    r'sottotitoli creati dalla comunità amara\.org.*?qtss\.?',
+    r'subtitles created by.*?community.*?amara\.org.*?qtss\.?',
+    r'sottotitoli e revisione a cura di.*?qtss\.?',
+    r'subtitles and revision by.*?qtss\.?',
+    r'traduzione e adattamento.*?qtss\.?',
+    r'translation and adaptation.*?qtss\.?'
+]
+
+# Literal every subtitle pattern requires; texts without it skip the regex scan
+SUBTITLE_ANCHOR = 'qtss'
+
+# Compiled once at import time and shared by every TranscriptionCleaner instance.
+# Inline flags keep the patterns portable between re2 and the stdlib engine.
+_SUBTITLE_RE = re_engine.compile('(?is)' + '|'.join(f'(?:{p})' for p in SUBTITLE_PATTERNS))
+_RE_SHORT_WORD = re.compile(r'\w{1,4}')
+# Run lengths at which repeated single characters / short words are collapsed
+_CHAR_RUN_MIN = 6
+_WORD_RUN_MIN = 9
+_TAIL_WINDOW = 32
+# Regex implementation kept for A/B comparison with the token collapser.
+# These rely on backreferences, which re2 does not support, so they stay on stdlib re.
+_RE_REPEAT_SHORT = re.compile(r'\b(\w{1,3})(?:\s+\1){10,}\b', re.IGNORECASE)
+_RE_REPEAT_CHAR = re.compile(r'\b(\w)\s+(?:\1\s+){5,}')
+_RE_LONG_SEQ = re.compile(r'\b(\w{1,4})(?:\s+\1){8,}(?:\s|$)')
+_RE_TRAIL_LETTER = re.compile(r'\s+([a-zA-Z])(?:\s+\1){2,}\s*$')
+
+
+def _compile_subtitle_database() -> Optional["hyperscan.Database"]:
+    """Compile the subtitle patterns into one Hyperscan database, if supported here."""
+    if hyperscan is None or platform.machine().lower() not in ("x86_64", "amd64"):
+        return None
+    
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_UTF8
+             | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH)
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[p.encode('utf-8') for p in SUBTITLE_PATTERNS],
+            ids=list(range(len(SUBTITLE_PATTERNS))),
+            elements=len(SUBTITLE_PATTERNS),
+            flags=[flags] * len(SUBTITLE_PATTERNS)
+        )
+        return database
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Hyperscan unavailable, using regex prefilter: {e}")
+        return None
+
+
+_SUBTITLE_DB = _compile_subtitle_database()
+# Hyperscan scratch space must not be shared between concurrent scans
+_hs_local = threading.local()
 
 
 class TranscriptionCleaner:
     """Handles cleaning and post-processing of transcription text."""
     
-    def __init__(self):
+    __slots__ = ('logger', '_use_regex_repetitions')
+    
+    def __init__(self, use_regex_repetitions: bool = False):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._subtitle_patterns = [
-            r'sottotitoli creati dalla comunità amara\.org.*?qtss\.?',
-            r'subtitles created by.*?community.*?amara\.org.*?qtss\.?',
-            r'sottotitoli e revisione a cura di.*?qtss\.?',
-            r'subtitles and revision by.*?qtss\.?',
-            r'traduzione e adattamento.*?qtss\.?',
-            r'translation and adaptation.*?qtss\.?'
-        ]
+        self._use_regex_repetitions = use_regex_repetitions
     
     def clean_text(self, text: str) -> str:
         """Clean up transcription by removing repetitive patterns and hallucinations."""
@@ -32,9 +96,8 @@ class TranscriptionCleaner:
         # Remove excessive repetitive patterns
         text = self._remove_repetitive_patterns(text)
         text = self._remove_trailing_repetitions(text)
-        text = self._cleanup_spaces(text)
-        
-        cleaned_text = text.strip()
+        # Also trims both ends
+        cleaned_text = self._cleanup_spaces(text)
         
         # Log cleaning results
         if len(cleaned_text) < original_length:
@@ -44,50 +107,107 @@ class TranscriptionCleaner:
         return cleaned_text
     
     def _remove_subtitle_credits(self, text: str) -> str:
-        """Remove common subtitle/credit patterns."""
-        for pattern in self._subtitle_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-        return text
+        """Remove common subtitle/credit patterns in a single pass."""
+        if not self._has_subtitle_credits(text):
+            return text
+        return _SUBTITLE_RE.sub('', text)
+    
+    def _has_subtitle_credits(self, text: str) -> bool:
+        """Cheaply detect whether any subtitle pattern can match."""
+        if _SUBTITLE_DB is not None:
+            matches = []
+            
+            def on_match(pattern_id, start, end, flags, context):
+                matches.append(pattern_id)
+                return True  # Stop at the first hit
+            
+            try:
+                scratch = getattr(_hs_local, "scratch", None)
+                if scratch is None:
+                    scratch = _hs_local.scratch = hyperscan.Scratch(_SUBTITLE_DB)
+                _SUBTITLE_DB.scan(text.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+                return bool(matches)
+            except Exception:
+                # Terminated scans may surface as errors; otherwise fall back to the literal check
+                if matches:
+                    return True
+        
+        return SUBTITLE_ANCHOR in text.casefold()
     
     def _remove_repetitive_patterns(self, text: str) -> str:
         """Remove patterns where short words repeat excessively."""
+        if self._use_regex_repetitions:
+            return self._remove_repetitive_patterns_regex(text)
+        return self._collapse_repeated_words(text)
+    
+    def _collapse_repeated_words(self, text: str) -> str:
+        """Collapse runs of identical short words into a single word.
+        
+        Single pass over whitespace-separated tokens (case-insensitive):
+        single characters collapse from 6 repeats, words of up to 4
+        characters from 9. No regex engine or backtracking is involved.
+        """
+        words = text.split()
+        collapsed = []
+        changed = False
+        i, n = 0, len(words)
+        
+        while i < n:
+            word = words[i]
+            j = i + 1
+            if _RE_SHORT_WORD.fullmatch(word):
+                key = word.lower()
+                while j < n and words[j].lower() == key:
+                    j += 1
+            run_min = _CHAR_RUN_MIN if len(word) == 1 else _WORD_RUN_MIN
+            if j - i >= run_min:
+                collapsed.append(word)
+                changed = True
+            else:
+                collapsed.extend(words[i:j])
+            i = j
+        
+        return ' '.join(collapsed) if changed else text
+    
+    def _remove_repetitive_patterns_regex(self, text: str) -> str:
+        """Regex implementation of _remove_repetitive_patterns."""
         # Match patterns where the same short word/syllable repeats many times
-        text = re.sub(r'\b(\w{1,3})(?:\s+\1){10,}\b', r'\1', text, flags=re.IGNORECASE)
+        text = _RE_REPEAT_SHORT.sub(r'\1', text)
         
         # Remove patterns where single characters repeat excessively
-        text = re.sub(r'\b(\w)\s+(?:\1\s+){5,}', r'\1 ', text)
+        text = _RE_REPEAT_CHAR.sub(r'\1 ', text)
         
         # Remove very long sequences of identical short words
-        text = re.sub(r'\b(\w{1,4})(?:\s+\1){8,}(?:\s|$)', ' ', text)
+        text = _RE_LONG_SEQ.sub(' ', text)
         
         return text
     
     def _remove_trailing_repetitions(self, text: str) -> str:
         """Remove repetitive endings from text."""
-        words = text.strip().split()
-        if len(words) <= 4:
-            return text
-        
-        # Check if the last several words are repetitive
-        last_word = words[-1]
-        repetition_count = 0
-        
-        for i in range(len(words) - 1, -1, -1):
-            if words[i] == last_word:
-                repetition_count += 1
-            else:
+        # Only tokenize the tail; widen the window if the repetition fills it
+        window = _TAIL_WINDOW
+        while True:
+            tail = text.rsplit(None, window)
+            if len(tail) <= 4:
+                return text
+            
+            # Check if the last several words are repetitive
+            last_word = tail[-1]
+            repetition_count = sum(1 for _ in takewhile(lambda w: w == last_word, reversed(tail)))
+            
+            if repetition_count < window or len(tail) <= window:
                 break
+            window *= 2
         
         # If we found many repetitions of the same word at the end, remove them
         if repetition_count > 5:
-            words = words[:-repetition_count + 1]
-            text = ' '.join(words)
+            text = text.rsplit(None, repetition_count - 1)[0]
         
         # Remove standalone single letters repeated at the end
-        text = re.sub(r'\s+([a-zA-Z])(?:\s+\1){2,}\s*$', '', text)
+        text = _RE_TRAIL_LETTER.sub('', text)
         
         return text
     
     def _cleanup_spaces(self, text: str) -> str:
-        """Clean up multiple spaces."""
-        return re.sub(r'\s+', ' ', text)
\ No newline at end of file
+        """Clean up multiple spaces (also trims the ends, as clean_text strips anyway)."""
+        return ' '.join(text.split())
\ No newline at end of file
@@ -1,116 +1,294 @@
 """Core transcription service implementation."""
 
+import asyncio
 import logging
 import os
+import shutil
 import tempfile
-from pathlib import Path
-from typing import Dict, Any
+import threading
+import time
+from concurrent.futures import Executor
+from types import MappingProxyType
+from typing import AsyncIterator, BinaryIO, Dict, Any, Iterator, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import torch
+import whisper
 from fastapi import UploadFile, HTTPException
 
-from ..core.config import QualityLevel, ModelSize, AppConfig
+from ..core.config import QualityLevel, ModelSize, AppConfig, WhisperBackend
 from ..core.interfaces import ModelManager
+from .audio import SAMPLE_RATE, AudioInput, decode_stream, keep_speech
 from .text_processing import TranscriptionCleaner
-from ..validation.file_validator import FileValidator
+from .batching import RequestBatcher
+from ..validation.file_validator import FileValidator, get_file_extension
+
+
+# Uploads are copied to disk in 1 MiB chunks
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# A GPU audio budget set by an OOM expires after this long, so the GPU gets retried
+GPU_BUDGET_TTL_SECONDS = 600
+
+# Read-only so the same mapping can be returned to every caller
+QUALITY_OPTIONS: Mapping[str, str] = MappingProxyType({
+    QualityLevel.FAST.value: "⚡ Fast (less accurate, tiny model)",
+    QualityLevel.BALANCED.value: "⚖️ Balanced (recommended, base model)",
+    QualityLevel.HIGH.value: "🎯 High quality (small model)",
+    QualityLevel.BEST.value: "🏆 Best quality (slower, large-v3-turbo model)"
+})
+
+MODEL_OPTIONS: Mapping[str, str] = MappingProxyType({
+    ModelSize.SMALL.value: "🏃 Small (fast, good accuracy)",
+    ModelSize.MEDIUM.value: "⚖️ Medium (balanced speed/accuracy)",
+    ModelSize.LARGE.value: "🏆 Large v3 (best accuracy, slower)",
+    ModelSize.TURBO.value: "🚀 Large v3 Turbo (near large-v3 accuracy, much faster)",
+    ModelSize.DISTIL.value: "💨 Distil Large v3 (fastest large model, English, faster-whisper only)"
+})
+
+# Decoding options shared by every request; only beam size and precision vary
+_FASTER_WHISPER_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    "beam_size": 5,
+    "vad_filter": True,  # Skip non-speech audio before decoding
+    "temperature": 0,  # Deterministic decoding
+    "no_speech_threshold": 0.6,  # Higher threshold to avoid hallucinations
+    "log_prob_threshold": -1.0,  # Filter out low-probability tokens
+    "compression_ratio_threshold": 2.4,  # Detect repetitive content
+    "condition_on_previous_text": False,  # Avoid context bleeding
+    "word_timestamps": False,  # Disable for better performance
+})
+# Greedy decoding for fast mode
+_FASTER_WHISPER_GREEDY_OPTIONS: Mapping[str, Any] = MappingProxyType({**_FASTER_WHISPER_OPTIONS, "beam_size": 1})
+
+_OPENAI_WHISPER_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    "fp16": False,
+    "verbose": False,
+    "temperature": 0,  # Deterministic decoding
+    "no_speech_threshold": 0.6,  # Higher threshold to avoid hallucinations
+    "logprob_threshold": -1.0,  # Filter out low-probability tokens
+    "compression_ratio_threshold": 2.4,  # Detect repetitive content
+    "condition_on_previous_text": False,  # Avoid context bleeding
+    "word_timestamps": False,  # Disable for better performance
+})
+_OPENAI_WHISPER_FP16_OPTIONS: Mapping[str, Any] = MappingProxyType({**_OPENAI_WHISPER_OPTIONS, "fp16": True})
 
 
 class TranscriptionService:
     """Service for handling audio transcription operations."""
     
     def __init__(self, model_manager: ModelManager, text_cleaner: TranscriptionCleaner, 
-                 file_validator: FileValidator, config: AppConfig):
+                 file_validator: FileValidator, config: AppConfig, batcher: RequestBatcher = None,
+                 executor: Executor = None):
         self.model_manager = model_manager
         self.text_cleaner = text_cleaner
         self.file_validator = file_validator
         self.config = config
+        self.batcher = batcher
+        self.executor = executor
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Model selection runs on worker threads and switches the manager's current model
+        self._select_lock = threading.Lock()
+        # (model name, device) -> (shortest audio seconds that OOMed, monotonic time recorded)
+        self._gpu_audio_budget: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._transcription_options = self._resolve_transcription_options()
+    
+    def warmup(self) -> None:
+        """Load the default quality model ahead of the first request.
+        
+        Freshly loaded models run a forward pass on silence, so lazy kernel
+        selection and JIT compilation also happen here.
+        """
+        self.model_manager.load_quality_model(QualityLevel.BALANCED)
     
     async def transcribe_file(self, file: UploadFile, quality: QualityLevel = QualityLevel.BALANCED, 
-                              model_size: ModelSize = None) -> str:
+                              model_size: ModelSize = None, batch_size: int = None) -> str:
         """Transcribe uploaded audio file to text."""
         # Validate file
         self.file_validator.validate_file(file)
         
         model_info = model_size.value if model_size else "quality-based"
-        self.logger.info(f"Processing file: {file.filename} with {quality.value} quality, model: {model_info}")
+        self.logger.info("Processing file: %s with %s quality, model: %s", file.filename, quality.value, model_info)
         
-        # Create temporary file
-        temp_file_path = await self._create_temp_file(file)
+        # Decode in memory, or spill to a temporary file for FFmpeg
+        audio = await self._prepare_audio(file)
         
         try:
-            # Get appropriate model
-            if model_size:
-                current_model = self.model_manager.load_model_by_size(model_size)
-            else:
-                current_model = self.model_manager.load_quality_model(quality)
+            # Get appropriate model (a cache miss loads weights from disk)
+            current_model, model_name = await asyncio.to_thread(self._select_model, quality, model_size)
             
             # Perform transcription
-            transcription = await self._perform_transcription(temp_file_path, current_model, quality)
+            transcription = await self._perform_transcription(
+                audio, current_model, model_name, quality, batch_size or self.config.batch_size
+            )
             
-            # Clean and return result
-            cleaned_transcription = self.text_cleaner.clean_text(transcription)
+            # Clean and return result (off the event loop; hallucinated repeats can be long)
+            cleaned_transcription = await asyncio.to_thread(self.text_cleaner.clean_text, transcription)
             
-            self.logger.info(f"Transcription completed for {file.filename}")
+            self.logger.info("Transcription completed for %s", file.filename)
             return cleaned_transcription
             
         finally:
             # Cleanup temporary file
-            self._cleanup_temp_file(temp_file_path)
+            await self._release_audio(audio)
     
-    async def _create_temp_file(self, file: UploadFile) -> str:
-        """Create temporary file for audio processing."""
-        file_extension = Path(file.filename).suffix.lower()
+    async def stream_transcription(self, file: UploadFile, quality: QualityLevel = QualityLevel.BALANCED,
+                                   model_size: ModelSize = None) -> AsyncIterator[str]:
+        """Prepare an upload and return an iterator over its raw segment texts.
+        
+        The upload is decoded (or copied to disk) before this returns, so the
+        iterator stays valid after the request body has been closed.
+        """
+        self.file_validator.validate_file(file)
+        
+        model_info = model_size.value if model_size else "quality-based"
+        self.logger.info("Streaming file: %s with %s quality, model: %s", file.filename, quality.value, model_info)
+        
+        audio = await self._prepare_audio(file)
         
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-                content = await file.read()
-                
-                # Check file size
-                if len(content) > self.config.max_file_size:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"File too large. Maximum size: {self.config.max_file_size / 1024 / 1024:.1f}MB"
-                    )
-                
-                temp_file.write(content)
-                return temp_file.name
+            current_model, _ = await asyncio.to_thread(self._select_model, quality, model_size)
+        except Exception:
+            await self._release_audio(audio)
+            raise
+        
+        return self._stream_segments(audio, current_model, quality)
+    
+    async def _stream_segments(self, audio: AudioInput, model, quality: QualityLevel) -> AsyncIterator[str]:
+        """Yield raw segment texts as the model decodes them."""
+        loop = asyncio.get_running_loop()
+        
+        try:
+            segments = await loop.run_in_executor(
+                self.executor, self._iter_segments, model, audio, self._get_transcription_options(quality)
+            )
+            
+            while True:
+                # Each step of the lazy generator runs the decoder, so keep it off the event loop
+                text = await loop.run_in_executor(self.executor, next, segments, None)
+                if text is None:
+                    break
                 
+                # Left uncleaned: segments keep their leading spaces so clients can concatenate them
+                if text:
+                    yield text
+        finally:
+            await self._release_audio(audio)
+    
+    def _iter_segments(self, model, audio: AudioInput, transcribe_options: Mapping[str, Any]) -> Iterator[str]:
+        """Start a transcription and return an iterator over segment texts."""
+        if self.model_manager.backend == WhisperBackend.FASTER:
+            segments, _ = model.transcribe(audio, **transcribe_options)
+            return (segment.text for segment in segments)
+        
+        # openai-whisper has no incremental API; segments arrive once decoding finishes
+        audio = self._openai_audio(audio, model)
+        with self.model_manager.inference_lock, torch.inference_mode():
+            result = model.transcribe(audio, **transcribe_options)
+        return iter([segment["text"] for segment in result["segments"]])
+    
+    def _select_model(self, quality: QualityLevel, model_size: ModelSize = None) -> Tuple[Any, str]:
+        """Get the model, and its name, for an explicit size or a quality level."""
+        with self._select_lock:
+            if model_size:
+                model = self.model_manager.load_model_by_size(model_size)
+            else:
+                model = self.model_manager.load_quality_model(quality)
+            # Read under the lock: a failed switch keeps the previous model and name
+            return model, self.model_manager.model_size
+    
+    async def _prepare_audio(self, file: UploadFile) -> AudioInput:
+        """Decode the upload in-process, falling back to a temporary file for FFmpeg."""
+        try:
+            # Saves writing the upload to disk and spawning FFmpeg for every request
+            return await asyncio.to_thread(self._decode_upload, file.file)
+        except HTTPException:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to create temporary file: {e}")
+            self.logger.warning("In-process decoding failed, falling back to FFmpeg: %s", e)
+        
+        return await self._create_temp_file(file)
+    
+    def _decode_upload(self, source: BinaryIO) -> np.ndarray:
+        """Decode an upload to 16 kHz mono samples (runs on a worker thread)."""
+        self._check_upload_size(source)
+        return decode_stream(source)
+    
+    async def _release_audio(self, audio: AudioInput) -> None:
+        """Delete the temporary file behind a path input; decoded samples need no cleanup."""
+        if isinstance(audio, str):
+            await asyncio.to_thread(self._cleanup_temp_file, audio)
+    
+    async def _create_temp_file(self, file: UploadFile) -> str:
+        """Stream the upload into a temporary file for audio processing."""
+        file_extension = get_file_extension(file.filename)
+        
+        try:
+            # One thread hop for the whole copy instead of one per chunk read and write
+            return await asyncio.to_thread(self._copy_upload, file.file, file_extension)
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            self.logger.error("Failed to create temporary file: %s", e)
             raise HTTPException(status_code=500, detail="Failed to process uploaded file")
     
-    async def _perform_transcription(self, file_path: str, model, quality: QualityLevel) -> str:
+    def _copy_upload(self, source: BinaryIO, suffix: str) -> str:
+        """Copy an upload to a temporary file in fixed-size chunks (runs on a worker thread)."""
+        self._check_upload_size(source)
+        
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+            try:
+                shutil.copyfileobj(source, temp_file, UPLOAD_CHUNK_SIZE)
+            except BaseException:
+                temp_file.close()
+                self._cleanup_temp_file(temp_file.name)
+                raise
+            
+            return temp_file.name
+    
+    def _check_upload_size(self, source: BinaryIO) -> None:
+        """Validate the upload size and rewind it."""
+        # The spooled upload is fully received, so its size is known before reading anything
+        source.seek(0, os.SEEK_END)
+        self.file_validator.validate_size(source.tell())
+        source.seek(0)
+    
+    async def _perform_transcription(self, audio: AudioInput, model, model_name: str, quality: QualityLevel,
+                                     batch_size: int = 1) -> str:
         """Perform the actual transcription."""
-        self.logger.info(f"Starting transcription with {quality.value} quality...")
+        self.logger.info("Starting transcription with %s quality...", quality.value)
         
         # Configure transcription options
-        transcribe_options = self._get_transcription_options()
+        transcribe_options = self._get_transcription_options(quality)
         
-        # Log GPU memory before transcription if using CUDA
+        # Log GPU memory before transcription if using CUDA.
+        # Cached blocks are kept between requests; the allocator reuses them.
         if self.model_manager.device == "cuda":
-            self.model_manager.cleanup_gpu_memory()
             self._log_gpu_memory("before transcription")
         
         try:
-            result = model.transcribe(file_path, **transcribe_options)
-            transcription = result["text"]
+            if self.batcher is not None:
+                # Shares encoder batches with other in-flight requests
+                transcription = await self.batcher.submit(
+                    model, audio, transcribe_options.get("beam_size", 1)
+                )
+            else:
+                transcription = await self._run_inference(model, model_name, audio, transcribe_options, batch_size)
             
             # Log GPU memory after transcription if using CUDA
             if self.model_manager.device == "cuda":
                 self._log_gpu_memory("after transcription")
-                self.model_manager.cleanup_gpu_memory()
             
             return transcription
             
         except FileNotFoundError as e:
-            self.logger.error(f"FFmpeg not found: {e}")
+            self.logger.error("FFmpeg not found: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail="FFmpeg is required but not found. Please install FFmpeg and ensure it's in your PATH. See documentation for setup instructions."
             )
         except Exception as e:
-            self.logger.error(f"Transcription error: {str(e)}")
+            self.logger.error("Transcription error: %s", e)
             if "ffmpeg" in str(e).lower():
                 raise HTTPException(
                     status_code=500,
@@ -118,47 +296,184 @@ class TranscriptionService:
                 )
             raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
     
-    def _get_transcription_options(self) -> Dict[str, Any]:
+    async def _run_inference(self, model, model_name: str, audio: AudioInput,
+                             transcribe_options: Mapping[str, Any], batch_size: int) -> str:
+        """Run the model on an inference thread, degrading gracefully when the GPU runs out of memory."""
+        # Inference threads share the single resident model instead of reloading it per worker
+        loop = asyncio.get_running_loop()
+        duration = self._audio_seconds(audio)
+        budget_key = (model_name, self.model_manager.device)
+        budget = self._gpu_budget(budget_key)
+        
+        if duration is not None and budget is not None and duration >= budget:
+            self.logger.info("%.0fs of audio exceeds the GPU budget, transcribing on CPU", duration)
+            return await self._run_on_cpu(model_name, audio, transcribe_options, batch_size)
+        
+        try:
+            text = await loop.run_in_executor(
+                self.executor, self._run_model, model, audio, transcribe_options, batch_size
+            )
+            self._record_gpu_success(budget_key, duration)
+            return text
+        except Exception as e:
+            if not self._is_out_of_memory(e):
+                raise
+            self.logger.warning("GPU out of memory, retrying with greedy unbatched decoding: %s", e)
+        
+        # Release cached blocks and retry once with the cheapest decoding settings
+        self.model_manager.cleanup_gpu_memory()
+        try:
+            text = await loop.run_in_executor(
+                self.executor, self._run_model, model, audio, self._reduced_options(transcribe_options), 1
+            )
+            self._record_gpu_success(budget_key, duration)
+            return text
+        except Exception as e:
+            if not self._is_out_of_memory(e):
+                raise
+            self.logger.warning("GPU still out of memory, falling back to CPU: %s", e)
+        
+        if duration is not None:
+            # Audio at least this long goes straight to the CPU until the budget expires
+            budget = self._gpu_budget(budget_key)
+            self._gpu_audio_budget[budget_key] = (
+                duration if budget is None else min(budget, duration), time.monotonic()
+            )
+        self.model_manager.cleanup_gpu_memory()
+        return await self._run_on_cpu(model_name, audio, transcribe_options, batch_size)
+    
+    def _gpu_budget(self, key: Tuple[str, str]) -> Optional[float]:
+        """Longest audio (seconds) worth attempting on the GPU for a model, or None when unlimited."""
+        entry = self._gpu_audio_budget.get(key)
+        if entry is None:
+            return None
+        seconds, recorded_at = entry
+        if time.monotonic() - recorded_at > GPU_BUDGET_TTL_SECONDS:
+            # Memory pressure from other requests may have passed; let the GPU try again
+            del self._gpu_audio_budget[key]
+            return None
+        return seconds
+    
+    def _record_gpu_success(self, key: Tuple[str, str], duration: Optional[float]) -> None:
+        """Lift a model's GPU budget once audio at least that long fits after all."""
+        budget = self._gpu_budget(key)
+        if duration is not None and budget is not None and duration >= budget:
+            del self._gpu_audio_budget[key]
+    
+    async def _run_on_cpu(self, model_name: str, audio: AudioInput, transcribe_options: Mapping[str, Any],
+                          batch_size: int) -> str:
+        """Transcribe with the (cached) CPU copy of a model."""
+        cpu_model = await asyncio.to_thread(self._load_cpu_model, model_name)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._run_model, cpu_model, audio, transcribe_options, batch_size
+        )
+    
+    def _load_cpu_model(self, model_name: str):
+        """Load the CPU fallback model (runs on a worker thread)."""
+        with self._select_lock:
+            return self.model_manager.load_cpu_model(model_name)
+    
+    @staticmethod
+    def _audio_seconds(audio: AudioInput) -> Optional[float]:
+        """Duration of decoded samples, or None for file paths (unknown without probing)."""
+        if isinstance(audio, str):
+            return None
+        return len(audio) / SAMPLE_RATE
+    
+    def _run_model(self, model, audio: AudioInput, transcribe_options: Mapping[str, Any], batch_size: int) -> str:
+        """Run the blocking model call (executed on an inference thread)."""
+        if self.model_manager.backend == WhisperBackend.FASTER:
+            # Batched pipeline splits audio on VAD boundaries and decodes chunks together;
+            # without VAD it has no chunk boundaries for audio over 30s, so decode sequentially
+            use_pipeline = batch_size > 1 and transcribe_options["vad_filter"]
+            pipeline = self.model_manager.get_batched_pipeline(model) if use_pipeline else None
+            if pipeline is not None:
+                segments, _ = pipeline.transcribe(audio, batch_size=batch_size, **transcribe_options)
+            else:
+                segments, _ = model.transcribe(audio, **transcribe_options)
+            
+            # faster-whisper yields segments lazily; joining drives the decode.
+            # CTranslate2 releases the GIL, so concurrent threads overlap on the device.
+            return "".join(segment.text for segment in segments)
+        
+        audio = self._openai_audio(audio, model)
+        with self.model_manager.inference_lock, torch.inference_mode():
+            result = model.transcribe(audio, **transcribe_options)
+        return result["text"]
+    
+    def _openai_audio(self, audio: AudioInput, model) -> Union[np.ndarray, torch.Tensor]:
+        """Return openai-whisper input: speech-only samples, on the GPU when available."""
+        if isinstance(audio, str):
+            audio = whisper.load_audio(audio)
+        
+        if self.config.vad_filter:
+            # openai-whisper has no VAD of its own, so silence would still go through the encoder
+            speech = keep_speech(audio)
+            self.logger.debug("VAD kept %.0f%% of the audio", 100 * len(speech) / max(len(audio), 1))
+            audio = speech
+        
+        if model.device.type == "cuda":
+            # log_mel_spectrogram runs on the input's device, so the STFT uses cuFFT
+            return torch.from_numpy(audio).to("cuda")
+        return audio
+    
+    def _is_out_of_memory(self, error: Exception) -> bool:
+        """Check whether an inference error is a CUDA out-of-memory failure."""
+        if self.model_manager.device != "cuda":
+            return False
+        # CTranslate2 reports OOM as a plain RuntimeError
+        return isinstance(error, torch.cuda.OutOfMemoryError) or "out of memory" in str(error).lower()
+    
+    @staticmethod
+    def _reduced_options(transcribe_options: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Options for an OOM retry: greedy decoding keeps a single hypothesis in memory."""
+        if "beam_size" not in transcribe_options:
+            return transcribe_options  # openai-whisper options already decode greedily
+        return {**transcribe_options, "beam_size": 1}
+    
+    def _get_transcription_options(self, quality: QualityLevel = QualityLevel.BALANCED) -> Mapping[str, Any]:
         """Get transcription configuration options."""
-        return {
-            "fp16": self.model_manager.device == "cuda",  # Enable FP16 for GPU
-            "verbose": False,
-            "temperature": 0,  # Deterministic decoding
-            "no_speech_threshold": 0.6,  # Higher threshold to avoid hallucinations
-            "logprob_threshold": -1.0,  # Filter out low-probability tokens
-            "compression_ratio_threshold": 2.4,  # Detect repetitive content
-            "condition_on_previous_text": False,  # Avoid context bleeding
-            "word_timestamps": False,  # Disable for better performance
-        }
+        return self._transcription_options[quality]
+    
+    def _resolve_transcription_options(self) -> Dict[QualityLevel, Mapping[str, Any]]:
+        """Pick the option constants for this backend and device once; requests only look them up."""
+        if self.model_manager.backend == WhisperBackend.FASTER:
+            options = {
+                quality: _FASTER_WHISPER_GREEDY_OPTIONS if quality == QualityLevel.FAST else _FASTER_WHISPER_OPTIONS
+                for quality in QualityLevel
+            }
+            if not self.config.vad_filter:
+                options = {quality: MappingProxyType({**opts, "vad_filter": False}) for quality, opts in options.items()}
+            return options
+        
+        # FP16 for GPU
+        openai_options = _OPENAI_WHISPER_FP16_OPTIONS if self.model_manager.fp16 else _OPENAI_WHISPER_OPTIONS
+        return dict.fromkeys(QualityLevel, openai_options)
     
     def _log_gpu_memory(self, context: str) -> None:
         """Log GPU memory usage."""
-        if self.model_manager.device == "cuda":
+        # Querying the allocator is not free, so skip it when the record would be dropped
+        if self.model_manager.device == "cuda" and self.logger.isEnabledFor(logging.INFO):
             memory_used = torch.cuda.memory_allocated(0) / 1024**3
-            self.logger.info(f"GPU memory {context}: {memory_used:.2f}GB")
+            self.logger.info("GPU memory %s: %.2fGB", context, memory_used)
     
     def _cleanup_temp_file(self, file_path: str) -> None:
         """Clean up temporary file."""
         try:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-                self.logger.debug(f"Cleaned up temporary file: {file_path}")
-        except Exception as e:
-            self.logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
+            os.unlink(file_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.logger.warning("Failed to cleanup temp file %s: %s", file_path, e)
+            return
+        
+        self.logger.debug("Cleaned up temporary file: %s", file_path)
     
-    def get_quality_options(self) -> Dict[str, str]:
+    def get_quality_options(self) -> Mapping[str, str]:
         """Get available quality options with descriptions."""
-        return {
-            QualityLevel.FAST.value: "⚡ Fast (less accurate, tiny model)",
-            QualityLevel.BALANCED.value: "⚖️ Balanced (recommended, base model)",
-            QualityLevel.HIGH.value: "🎯 High quality (small model)",
-            QualityLevel.BEST.value: "🏆 Best quality (very slow, medium model)"
-        }
-    
-    def get_model_options(self) -> Dict[str, str]:
+        return QUALITY_OPTIONS
+    
+    def get_model_options(self) -> Mapping[str, str]:
         """Get available model size options with descriptions."""
-        return {
-            ModelSize.SMALL.value: "🏃 Small (fast, good accuracy)",
-            ModelSize.MEDIUM.value: "⚖️ Medium (balanced speed/accuracy)",
-            ModelSize.LARGE.value: "🏆 Large v3 (best accuracy, slower)"
-        }
\ No newline at end of file
+        return MODEL_OPTIONS
\ No newline at end of file
@@ -1,14 +1,26 @@
 """File validation utilities."""
 
 import logging
-from pathlib import Path
-from typing import Set
 
 from fastapi import UploadFile, HTTPException
 
 from ..core.config import AppConfig
 
 
+def get_file_extension(filename: str) -> str:
+    """Return the lowercased extension of a file name including the dot, or '' if there is none.
+    
+    Equivalent to ``Path(filename).suffix.lower()`` (dotfiles and trailing dots
+    have no extension) without building a Path; Windows separators are honoured too.
+    """
+    # Plain string slicing avoids building a Path for every upload
+    name = filename[max(filename.rfind('/'), filename.rfind('\\')) + 1:]
+    dot = name.rfind('.')
+    if dot <= 0 or dot == len(name) - 1:
+        return ''
+    return name[dot:].lower()
+
+
 class FileValidator:
     """Handles file validation for uploads."""
     
@@ -29,24 +41,30 @@ class FileValidator:
     
     def _check_file_format(self, file: UploadFile) -> None:
         """Check if file format is supported."""
-        file_extension = Path(file.filename).suffix.lower()
+        file_extension = get_file_extension(file.filename)
         if file_extension not in self.config.supported_formats:
-            supported_list = ', '.join(sorted(self.config.supported_formats))
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported file format '{file_extension}'. Supported formats: {supported_list}"
+                detail=f"Unsupported file format '{file_extension}'. Supported formats: {self.config.supported_formats_display}"
             )
     
     def _check_file_size(self, file: UploadFile) -> None:
         """Check if file size is within limits."""
         # Note: FastAPI's UploadFile doesn't provide size directly
-        # Size checking would be implemented during file reading
+        # The service checks the spooled upload's size once (seek/tell) via validate_size before reading it
         pass
     
+    def validate_size(self, size: int) -> None:
+        """Check an upload's total size against the limit."""
+        if size > self.config.max_file_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {self.config.max_file_size / 1024 / 1024:.1f}MB"
+            )
+    
     def is_valid_audio_extension(self, filename: str) -> bool:
         """Check if filename has a valid audio extension."""
         if not filename:
             return False
         
-        extension = Path(filename).suffix.lower()
-        return extension in self.config.supported_formats
\ No newline at end of file
+        return get_file_extension(filename) in self.config.supported_formats